@@ -5,7 +5,7 @@ Scrape Eventbrite for veteran events in Montana and Wyoming over the next 60 day
 This script queries the Eventbrite API for events matching veteran‑related terms in the
 states of Montana and Wyoming. It validates the API token, paginates through search
 results, filters events to those occurring within the next LOOKAHEAD_DAYS, deduplicates
-them by (name, start), and writes both a machine‑readable JSON file and a human‑
+them by Eventbrite id, and writes both a machine‑readable JSON file and a human‑
 friendly Markdown file.
 
 The script always produces diagnostic output. On success, events.json will contain
@@ -15,14 +15,30 @@ contain {"generated": false, "error": ...}, and events.md will note that no even
 were found.
 """
 
+import hashlib
 import json
 import os
+import re
 import sys
 import time
-from datetime import datetime, timedelta
-from typing import Dict, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Tuple, Union
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import MaxRetryError, ResponseError
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON encoding/decoding when available
+    orjson = None
+
+try:
+    from requests_cache import DO_NOT_CACHE, CachedSession, create_key
+except ImportError:  # Optional: on-disk HTTP cache between runs when available
+    CachedSession = None
 
 # API configuration
 API_BASE = "https://www.eventbriteapi.com/v3"
@@ -37,57 +53,95 @@ DEFAULT_QUERY = os.environ.get(
 DEFAULT_WITHIN = os.environ.get("EVENTBRITE_WITHIN", "500mi")
 LOOKAHEAD_DAYS = int(os.environ.get("EVENTBRITE_DAYS", "60"))
 PAGE_DELAY_SEC = float(os.environ.get("EVENTBRITE_PAGE_DELAY_SEC", "0.5"))
+MAX_PAGES = int(os.environ.get("EVENTBRITE_MAX_PAGES", "50"))
+MAX_RETRY_AFTER_SEC = float(os.environ.get("EVENTBRITE_MAX_RETRY_AFTER_SEC", "60"))
+CACHE_DIR = os.environ.get(
+    "EVENTBRITE_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "mt-wy-veteran-events"),
+)
+TOKEN_CACHE_TTL_SEC = float(os.environ.get("EVENTBRITE_TOKEN_CACHE_TTL_SEC", "3600"))
+HTTP_CACHE_TTL_SEC = int(os.environ.get("EVENTBRITE_HTTP_CACHE_TTL_SEC", "3600"))
+ISO_FORMAT = "%Y-%m-%dT%H:%M:%S"
+_ISO_RE = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}")
+_START_TRANS = str.maketrans({"T": " ", "Z": ""})
 
 
-def save_json(payload: Dict, path: str = OUT_JSON) -> None:
-    """Write a dict to a JSON file with UTF‑8 encoding."""
+class CappedRetry(Retry):
+    """Retry policy that gives up instead of sleeping past MAX_RETRY_AFTER_SEC for a Retry-After.
+
+    Eventbrite's rate limits are hourly, so an uncapped Retry-After could stall a worker for
+    the rest of the run. Giving up returns the 429 to the caller (raise_on_status=False),
+    which reports it as a rate_limited_http_429 warning.
+    """
+
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
+        # Only statuses where urllib3 actually honors Retry-After (413/429/503) are capped
+        if response is not None and response.status in self.RETRY_AFTER_STATUS_CODES:
+            retry_after = self.get_retry_after(response)
+            if retry_after is not None and retry_after > MAX_RETRY_AFTER_SEC:
+                raise MaxRetryError(_pool, url, ResponseError(f"Retry-After of {retry_after:.0f}s exceeds cap"))
+        return super().increment(method, url, response, error, _pool, _stacktrace)
+
+
+def utc_now() -> datetime:
+    """Return the current UTC time as a naive datetime (replaces deprecated datetime.utcnow)."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _write_atomic(path: str, data: Union[str, bytes]) -> None:
+    """Write data to a sibling temp file and rename it over `path` so readers never see a partial file."""
     os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(payload, f, ensure_ascii=False, indent=2)
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    tmp = path + ".tmp"
+    try:
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+def save_json(payload: Dict, path: str = OUT_JSON) -> None:
+    """Write a dict to a JSON file with UTF‑8 encoding, using orjson when installed."""
+    if orjson is not None:
+        data = orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        data = json.dumps(payload, ensure_ascii=False, indent=2)
+    _write_atomic(path, data)
+
+
+def _format_event(e: Dict) -> str:
+    """Render one event as a Markdown section, omitting lines for missing fields."""
+    start = e.get("start") or ""
+    # ISO starts are shown as "YYYY-MM-DD HH:MM" straight from the string
+    start_fmt = (start[:16] if _ISO_RE.match(start) else start).translate(_START_TRANS)
+    location = ", ".join(filter(None, (e.get("venue_name"), e.get("address"), e.get("city"), e.get("state"))))
+    url = e.get("url")
+    return (
+        f"## {e.get('name') or 'Unnamed Event'}\n\n"
+        + (f"- **Date:** {start_fmt}\n" if start_fmt else "")
+        + (f"- **Location:** {location}\n" if location else "")
+        + (f"- **Sign up:** [{url}]({url})\n" if url else "")
+    )
 
 
 def save_markdown(events: List[Dict], path: str = OUT_MD) -> None:
     """Render a list of events to a Markdown file for easy reading."""
-    lines: List[str] = []
-    lines.append("# Upcoming Veteran Events in Montana and Wyoming\n")
-    if not events:
-        lines.append(f"No events found within the next {LOOKAHEAD_DAYS} days.\n")
+    if events:
+        body = "\n".join(_format_event(e) for e in events)
     else:
-        for e in events:
-            name = e.get("name") or "Unnamed Event"
-            lines.append(f"## {name}\n")
-            start = e.get("start") or ""
-            # Fix: Handle timezone-aware datetime formatting
-            start_fmt = ""
-            if start:
-                try:
-                    # Parse and format datetime properly
-                    dt = datetime.fromisoformat(start.replace('Z', '+00:00'))
-                    start_fmt = dt.strftime('%Y-%m-%d %H:%M')
-                except (ValueError, AttributeError):
-                    start_fmt = start.replace("T", " ").replace("Z", "")
-            if start_fmt:
-                lines.append(f"- **Date:** {start_fmt}\n")
-            
-            loc_parts: List[str] = []
-            if e.get("venue_name"):
-                loc_parts.append(e["venue_name"])
-            if e.get("address"):
-                loc_parts.append(e["address"])
-            if e.get("city"):
-                loc_parts.append(e["city"])
-            if e.get("state"):
-                loc_parts.append(e["state"])
-            if loc_parts:
-                lines.append(f"- **Location:** {', '.join(loc_parts)}\n")
-            url = e.get("url")
-            if url:
-                lines.append(f"- **Sign up:** [{url}]({url})\n")
-            lines.append("")
-    
-    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        f.write("\n".join(lines))
+        body = f"No events found within the next {LOOKAHEAD_DAYS} days.\n"
+    _write_atomic(path, "# Upcoming Veteran Events in Montana and Wyoming\n\n" + body)
+
+
+def parse_json(content: bytes):
+    """Decode a JSON response body, using orjson when installed. Raises ValueError on bad input."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
 
 
 def get_token() -> str:
@@ -101,12 +155,49 @@ def get_token() -> str:
     return token.strip()  # Fix: Strip whitespace from token
 
 
-def validate_token(session: requests.Session, headers: Dict[str, str]) -> None:
-    """Validate the token by calling the /users/me endpoint. Raises RuntimeError on failure."""
+def _token_cache_path(token: str) -> str:
+    """Return the marker file recording a recent successful validation of `token`."""
+    digest = hashlib.sha256(token.encode("utf-8")).hexdigest()
+    return os.path.join(CACHE_DIR, f"token-{digest}")
+
+
+def _forget_token_validation(token: str) -> None:
+    """Remove the validation marker for `token` so the next run probes /users/me again."""
+    try:
+        os.remove(_token_cache_path(token))
+    except OSError:
+        pass
+
+
+def _http_cache_key(request, **kwargs) -> str:
+    """requests-cache key that also varies on the Authorization header.
+
+    requests-cache ignores Authorization by default (and redacts it from stored requests);
+    appending a hash keeps responses separate per token without writing the token to disk.
+    """
+    auth = request.headers.get("Authorization") or ""
+    digest = hashlib.sha256(auth.encode("utf-8")).hexdigest()[:16]
+    return f"{create_key(request, **kwargs)}-{digest}"
+
+
+def validate_token(session: requests.Session, token: str) -> None:
+    """Validate the token by calling the /users/me endpoint. Raises RuntimeError on failure.
+
+    A successful validation is remembered on disk for TOKEN_CACHE_TTL_SEC so repeated
+    runs skip the round-trip.
+    """
+    cache_path = _token_cache_path(token)
+    try:
+        if time.time() - os.path.getmtime(cache_path) < TOKEN_CACHE_TTL_SEC:
+            print("Token validated recently; skipping check")
+            return
+    except OSError:
+        pass
+    
     url = f"{API_BASE}/users/me/"
     print(f"Validating token with URL: {url}")
     try:
-        resp = session.get(url, headers=headers, timeout=15)
+        resp = session.get(url, timeout=15)
         print(f"Token validation response: {resp.status_code}")
     except requests.RequestException as exc:
         print(f"Token validation request error: {exc}", file=sys.stderr)
@@ -114,6 +205,13 @@ def validate_token(session: requests.Session, headers: Dict[str, str]) -> None:
     
     if resp.status_code == 200:
         print("Token validation successful")
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            with open(cache_path, "a", encoding="utf-8"):
+                pass
+            os.utime(cache_path, None)
+        except OSError as exc:
+            print(f"Could not cache token validation: {exc}", file=sys.stderr)
         return
     elif resp.status_code in (401, 403):
         print(f"Token invalid or forbidden: {resp.status_code} - {resp.text[:256]}", file=sys.stderr)
@@ -128,16 +226,16 @@ def validate_token(session: requests.Session, headers: Dict[str, str]) -> None:
 
 def search_region(
     session: requests.Session,
-    headers: Dict[str, str],
     query: str,
     location_address: str,
     within: str,
+    start_date: str,
+    end_date: str,
 ) -> Tuple[List[Dict], List[str]]:
-    """Perform a paginated search on Eventbrite for a single region."""
-    # Fix: Add start_date parameter to ensure we get upcoming events
-    start_date = datetime.utcnow().strftime('%Y-%m-%dT%H:%M:%SZ')
-    end_date = (datetime.utcnow() + timedelta(days=LOOKAHEAD_DAYS)).strftime('%Y-%m-%dT%H:%M:%SZ')
-    
+    """Perform a paginated search on Eventbrite for a single region, returning normalized events.
+
+    The start_date/end_date window is sent to the API so out-of-range events are never paged through.
+    """
     params = {
         "q": query,
         "location.address": location_address,
@@ -146,22 +244,21 @@ def search_region(
         "start_date.range_end": end_date,
         "expand": "venue",
         "sort_by": "date",
-        "page": 1,
     }
     print(f"Searching region: {location_address} with query: {query}")
     print(f"Date range: {start_date} to {end_date}")
     
     results: List[Dict] = []
     warnings: List[str] = []
-    page_count = 0
-    max_pages = 50  # Fix: Prevent infinite loops
+    url = f"{API_BASE}/events/search/"  # Fix: Ensure trailing slash consistency
+    page = 1
     
-    while page_count < max_pages:
-        url = f"{API_BASE}/events/search/"  # Fix: Ensure trailing slash consistency
-        print(f"Fetching page {params['page']} for {location_address}")
+    while page <= MAX_PAGES:  # Fix: Prevent infinite loops
+        params["page"] = page
+        print(f"Fetching page {page} for {location_address}")
         
         try:
-            resp = session.get(url, headers=headers, params=params, timeout=30)
+            resp = session.get(url, params=params, timeout=30)
             print(f"Response status: {resp.status_code}")
         except requests.RequestException as exc:
             error_msg = f"request_error:{location_address}:{exc}"
@@ -183,8 +280,6 @@ def search_region(
             warning_msg = f"rate_limited_http_429:{location_address}:{resp.text[:256]}"
             print(f"Rate limited: {warning_msg}", file=sys.stderr)
             warnings.append(warning_msg)
-            # Fix: Add longer delay for rate limiting
-            time.sleep(5)
             break
         elif resp.status_code != 200:
             warning_msg = f"http_{resp.status_code}:{location_address}:{resp.text[:256]}"
@@ -193,30 +288,37 @@ def search_region(
             break
         
         try:
-            data = resp.json()
+            data = parse_json(resp.content)
         except ValueError as e:
             warning_msg = f"invalid_json_response:{location_address}:{resp.text[:256]}"
             print(f"JSON parsing error: {warning_msg}", file=sys.stderr)
             warnings.append(warning_msg)
             break
         
-        page_events = data.get("events", [])
+        # Normalize per page so only the small dicts outlive the decoded response
+        page_events = normalize_events(data.get("events", []))
         results.extend(page_events)
-        print(f"Found {len(page_events)} events on page {params['page']}")
+        print(f"Found {len(page_events)} events on page {page}")
         
         pagination = data.get("pagination", {})
         if not pagination.get("has_more_items", False):
             print(f"No more pages for {location_address}")
             break
         
-        params["page"] = int(params.get("page", 1)) + 1
-        page_count += 1
+        page += 1
         time.sleep(PAGE_DELAY_SEC)
     
     print(f"Total events found for {location_address}: {len(results)}")
     return results, warnings
 
 
+def _nested_value(obj, key: str):
+    """Return obj[key] for Eventbrite's nested {"text"/"local": ...} fields, else obj as a string."""
+    if isinstance(obj, dict):
+        return obj.get(key)
+    return str(obj) if obj else None
+
+
 def normalize_events(events: List[Dict]) -> List[Dict]:
     """Normalize raw Eventbrite events into a simplified structure."""
     normalized: List[Dict] = []
@@ -224,32 +326,19 @@ def normalize_events(events: List[Dict]) -> List[Dict]:
         try:
             venue = e.get("venue") or {}
             address = venue.get("address") or {}
-            
-            # Fix: Handle nested name structure properly
-            name_obj = e.get("name", {})
-            name = name_obj.get("text") if isinstance(name_obj, dict) else str(name_obj) if name_obj else None
-            
-            # Fix: Handle nested start/end structure properly
-            start_obj = e.get("start", {})
-            start = start_obj.get("local") if isinstance(start_obj, dict) else str(start_obj) if start_obj else None
-            
-            end_obj = e.get("end", {})
-            end = end_obj.get("local") if isinstance(end_obj, dict) else str(end_obj) if end_obj else None
-            
-            normalized_event = {
+            normalized.append({
                 "id": e.get("id"),
-                "name": name,
+                "name": _nested_value(e.get("name", {}), "text"),
                 "url": e.get("url"),
-                "start": start,
-                "end": end,
+                "start": _nested_value(e.get("start", {}), "local"),
+                "end": _nested_value(e.get("end", {}), "local"),
                 "is_free": e.get("is_free"),
                 "status": e.get("status"),
                 "city": address.get("city"),
                 "state": address.get("region"),
                 "venue_name": venue.get("name"),
                 "address": address.get("localized_address_display"),
-            }
-            normalized.append(normalized_event)
+            })
         except Exception as ex:
             print(f"Error normalizing event {e.get('id', 'unknown')}: {ex}", file=sys.stderr)
             continue
@@ -257,43 +346,39 @@ def normalize_events(events: List[Dict]) -> List[Dict]:
     return normalized
 
 
-def filter_upcoming(events: List[Dict], days: int = LOOKAHEAD_DAYS) -> List[Dict]:
-    """Return events starting within the next `days` days."""
-    now = datetime.utcnow()
-    cutoff = now + timedelta(days=days)
-    filtered: List[Dict] = []
-    
+def _start_in_window(start, now_str: str, cutoff_str: str) -> bool:
+    """Return True if an ISO start string falls between now_str and cutoff_str."""
+    if not start or not isinstance(start, str):
+        return False
+    # Eventbrite's local start is a zero-padded YYYY-MM-DDTHH:MM:SS string, so
+    # lexicographic order matches chronological order and no parsing is needed.
+    # Other shapes are rejected by the regex rather than a failing parse.
+    if not _ISO_RE.match(start):
+        return False
+    return now_str <= start[:19] <= cutoff_str
+
+
+def build_unique(events: List[Dict], now: datetime, cutoff: datetime) -> List[Dict]:
+    """Date-filter and deduplicate events by Eventbrite id in a single pass.
+
+    Takes the already-normalized events returned by search_region. Events without an id
+    fall back to a canonical (name, start) key. The search already restricts the date range
+    server-side; the window check here is defensive. `now` and `cutoff` are naive UTC.
+    """
+    now_str = now.strftime(ISO_FORMAT)
+    cutoff_str = cutoff.strftime(ISO_FORMAT)
+    dedup: Dict[Union[str, Tuple], Dict] = {}
     for e in events:
         start = e.get("start")
-        if not start:
+        if not _start_in_window(start, now_str, cutoff_str):
             continue
-        
-        try:
-            # Fix: Handle different datetime formats more robustly
-            if isinstance(start, str):
-                # Handle various ISO formats
-                if start.endswith('Z'):
-                    dt = datetime.fromisoformat(start.replace('Z', '+00:00'))
-                elif '+' in start or start.endswith(('00', '30')):  # Has timezone
-                    dt = datetime.fromisoformat(start)
-                else:
-                    # Assume local time, parse as naive datetime
-                    dt = datetime.fromisoformat(start)
-            else:
-                continue
-                
-            # Convert to UTC for comparison if timezone-aware
-            if dt.tzinfo is not None:
-                dt = dt.utctimezone() if hasattr(dt, 'utctimezone') else dt.replace(tzinfo=None)
-                
-        except (ValueError, AttributeError) as ex:
-            print(f"Error parsing datetime '{start}' for event {e.get('id', 'unknown')}: {ex}", file=sys.stderr)
-            continue
-        
-        if now <= dt <= cutoff:
-            filtered.append(e)
+        name = e.get("name")
+        # Canonicalize the fallback name so cosmetic variants (case, padding) collapse
+        key = e.get("id") or ((name or "").strip().casefold(), start)
+        if dedup.setdefault(key, e) is not e:
+            print(f"Skipping duplicate event: {name}")
     
-    return filtered
+    return list(dedup.values())
 
 
 def fetch_events(token: str, query: str = DEFAULT_QUERY, states: List[str] = None, within: str = DEFAULT_WITHIN) -> Dict:
@@ -312,41 +397,81 @@ def fetch_events(token: str, query: str = DEFAULT_QUERY, states: List[str] = Non
     
     print(f"Using query: '{query}' for states: {states} within {within}")
     
-    session = requests.Session()
-    # Set session defaults
+    if CachedSession is not None:
+        # Reuse unchanged responses across runs (honoring Cache-Control/ETags). The search
+        # window is rounded to the clock hour, so cached pages only help runs within the same
+        # hour; older entries are pruned on startup so the sqlite file doesn't grow forever.
+        # Responses are keyed per token, and /users/me/ is never served from this cache.
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        session = CachedSession(
+            os.path.join(CACHE_DIR, "evbr_cache"),
+            backend="sqlite",
+            expire_after=HTTP_CACHE_TTL_SEC,
+            urls_expire_after={f"{API_BASE}/users/me/": DO_NOT_CACHE},
+            key_fn=_http_cache_key,
+            cache_control=True,
+        )
+        session.cache.delete(expired=True)
+    else:
+        session = requests.Session()
+    # Back off on 429/5xx (honoring Retry-After up to MAX_RETRY_AFTER_SEC) instead of failing
+    # the region outright; the final response is still returned so the status handling reports it
+    retry = CappedRetry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=("GET",),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    # Size the connection pool for one worker per state so parallel searches don't contend
+    workers = max(len(states), 1)
+    adapter = HTTPAdapter(pool_connections=workers, pool_maxsize=workers * 4, max_retries=retry)
+    session.mount("https://", adapter)
+    # Set session defaults; individual requests no longer pass headers
     session.headers.update(headers)
     
     try:
         # Validate token early
-        validate_token(session, headers)
+        validate_token(session, token)
         
-        all_raw: List[Dict] = []
+        all_events: List[Dict] = []
         all_warnings: List[str] = []
         
-        for state in states:
-            print(f"\n--- Searching {state} ---")
-            events, warns = search_region(session, headers, query, state, within)
-            all_raw.extend(events)
-            all_warnings.extend(warns)
-            print(f"Accumulated {len(all_raw)} total raw events so far")
+        now = utc_now()
+        cutoff = now + timedelta(days=LOOKAHEAD_DAYS)
+        # The API window is widened to whole hours so repeated runs send identical,
+        # cacheable queries; build_unique still trims to the exact window afterwards
+        hour = now.replace(minute=0, second=0, microsecond=0)
+        range_start = hour.strftime(ISO_FORMAT) + "Z"
+        range_end = (hour + timedelta(days=LOOKAHEAD_DAYS, hours=1)).strftime(ISO_FORMAT) + "Z"
         
-        print(f"\n--- Processing {len(all_raw)} raw events ---")
-        normalized = normalize_events(all_raw)
-        print(f"Normalized to {len(normalized)} events")
+        # Searches are I/O bound, so run one per state concurrently, but collect results
+        # in state order so the output (and which duplicate is kept) is deterministic
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            futures = [
+                (state, ex.submit(search_region, session, query, state, within, range_start, range_end))
+                for state in states
+            ]
+            auth_errors: List[str] = []
+            for state, fut in futures:
+                events, warns = fut.result()
+                all_events.extend(events)
+                all_warnings.extend(warns)
+                # search_region stops a region at its first auth error, so it is the last warning
+                if warns and warns[-1].startswith("auth_error_"):
+                    auth_errors.append(warns[-1])
+                print(f"\n--- Finished {state} ---")
+                print(f"Accumulated {len(all_events)} total events so far")
         
-        upcoming = filter_upcoming(normalized, LOOKAHEAD_DAYS)
-        print(f"Filtered to {len(upcoming)} upcoming events")
+        # The token may have been revoked since its validation was cached
+        if auth_errors:
+            _forget_token_validation(token)
+            if len(auth_errors) == len(states):
+                raise RuntimeError(f"token_invalid_or_forbidden:{auth_errors[0][len('auth_error_'):]}")
         
-        # Deduplicate events by (name, start)
-        seen = set()
-        unique: List[Dict] = []
-        for e in upcoming:
-            key = (e.get("name"), e.get("start"))
-            if key in seen:
-                print(f"Skipping duplicate event: {e.get('name')}")
-                continue
-            seen.add(key)
-            unique.append(e)
+        print(f"\n--- Processing {len(all_events)} events ---")
+        unique = build_unique(all_events, now, cutoff)
         
         print(f"Final unique events: {len(unique)}")
         
@@ -359,7 +484,7 @@ def fetch_events(token: str, query: str = DEFAULT_QUERY, states: List[str] = Non
             "count": len(unique),
             "events": unique,
             "warnings": all_warnings,
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": utc_now().isoformat() + "Z",
         }
         
     except Exception as exc:
@@ -395,7 +520,7 @@ def main() -> int:
         error_payload = {
             "generated": False, 
             "error": str(exc),
-            "timestamp": datetime.utcnow().isoformat() + "Z"
+            "timestamp": utc_now().isoformat() + "Z"
         }
         save_json(error_payload, OUT_JSON)
         save_markdown([], OUT_MD)
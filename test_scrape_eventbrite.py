@@ -0,0 +1,260 @@
+import os
+import time
+from datetime import datetime, timedelta
+
+import pytest
+from urllib3.exceptions import MaxRetryError
+from urllib3.response import HTTPResponse
+
+import scrape_eventbrite as se
+
+NOW = datetime(2024, 5, 1, 12, 0, 0)
+CUTOFF = NOW + timedelta(days=60)
+
+
+def make_event(id=None, name="Veterans Breakfast", start="2024-05-10T08:00:00", **extra):
+    event = {"id": id, "name": name, "start": start}
+    event.update(extra)
+    return event
+
+
+def test_build_unique_dedups_by_id():
+    events = [
+        make_event(id="1", name="Breakfast"),
+        make_event(id="1", name="Breakfast (copy)", start="2024-05-11T08:00:00"),
+        make_event(id="2", name="Breakfast"),
+    ]
+    unique = se.build_unique(events, NOW, CUTOFF)
+    assert [e["id"] for e in unique] == ["1", "2"]
+    assert unique[0]["name"] == "Breakfast"
+
+
+def test_build_unique_falls_back_to_name_and_start_without_id():
+    events = [
+        make_event(name="Honor Flight"),
+        make_event(name="  honor flight "),
+        make_event(name="Honor Flight", start="2024-05-12T08:00:00"),
+    ]
+    unique = se.build_unique(events, NOW, CUTOFF)
+    assert [(e["name"], e["start"]) for e in unique] == [
+        ("Honor Flight", "2024-05-10T08:00:00"),
+        ("Honor Flight", "2024-05-12T08:00:00"),
+    ]
+
+
+@pytest.mark.parametrize(
+    "start, expected",
+    [
+        ("2024-05-10T08:00:00", True),
+        ("2024-05-01T12:00:00", True),
+        ("2024-06-30T12:00:00", True),
+        ("2024-05-10T08:00:00Z", True),
+        ("2024-04-30T23:59:59", False),
+        ("2024-06-30T12:00:01", False),
+        ("2024-05-10", False),
+        ("May 10, 2024", False),
+        ("", False),
+        (None, False),
+    ],
+)
+def test_build_unique_date_window(start, expected):
+    unique = se.build_unique([make_event(id="1", start=start)], NOW, CUTOFF)
+    assert bool(unique) is expected
+
+
+def test_save_markdown_renders_all_fields(tmp_path):
+    path = tmp_path / "events.md"
+    se.save_markdown(
+        [
+            {
+                "name": "Stand Down",
+                "start": "2024-05-10T08:30:00",
+                "venue_name": "VFW Post 1",
+                "address": "1 Main St",
+                "city": "Billings",
+                "state": "MT",
+                "url": "https://example.com/e/1",
+            },
+            {"name": None, "start": "sometime", "city": "Casper"},
+        ],
+        str(path),
+    )
+    assert path.read_text(encoding="utf-8") == (
+        "# Upcoming Veteran Events in Montana and Wyoming\n"
+        "\n"
+        "## Stand Down\n"
+        "\n"
+        "- **Date:** 2024-05-10 08:30\n"
+        "- **Location:** VFW Post 1, 1 Main St, Billings, MT\n"
+        "- **Sign up:** [https://example.com/e/1](https://example.com/e/1)\n"
+        "\n"
+        "## Unnamed Event\n"
+        "\n"
+        "- **Date:** sometime\n"
+        "- **Location:** Casper\n"
+    )
+
+
+def test_save_markdown_omits_missing_fields(tmp_path):
+    path = tmp_path / "events.md"
+    se.save_markdown([{"name": "Coffee"}], str(path))
+    assert path.read_text(encoding="utf-8") == (
+        "# Upcoming Veteran Events in Montana and Wyoming\n\n## Coffee\n\n"
+    )
+
+
+def test_save_markdown_without_events(tmp_path):
+    path = tmp_path / "events.md"
+    se.save_markdown([], str(path))
+    assert path.read_text(encoding="utf-8") == (
+        "# Upcoming Veteran Events in Montana and Wyoming\n\n"
+        f"No events found within the next {se.LOOKAHEAD_DAYS} days.\n"
+    )
+
+
+def test_write_atomic_removes_temp_file_on_failure(tmp_path, monkeypatch):
+    path = tmp_path / "events.json"
+    path.write_text("previous", encoding="utf-8")
+
+    def fail_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(se.os, "replace", fail_replace)
+    with pytest.raises(OSError):
+        se._write_atomic(str(path), "new")
+    assert path.read_text(encoding="utf-8") == "previous"
+    assert not (tmp_path / "events.json.tmp").exists()
+
+
+def make_retry():
+    return se.CappedRetry(
+        total=5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=("GET",),
+        raise_on_status=False,
+    )
+
+
+def test_capped_retry_gives_up_on_long_retry_after(monkeypatch):
+    monkeypatch.setattr(se, "MAX_RETRY_AFTER_SEC", 60)
+    resp = HTTPResponse(status=429, headers={"Retry-After": "3600"})
+    with pytest.raises(MaxRetryError):
+        make_retry().increment("GET", "/events/search/", response=resp)
+
+
+def test_capped_retry_allows_short_retry_after(monkeypatch):
+    monkeypatch.setattr(se, "MAX_RETRY_AFTER_SEC", 60)
+    resp = HTTPResponse(status=429, headers={"Retry-After": "30"})
+    retry = make_retry().increment("GET", "/events/search/", response=resp)
+    assert isinstance(retry, se.CappedRetry)
+    assert retry.total == 4
+
+
+def test_capped_retry_ignores_retry_after_on_other_statuses(monkeypatch):
+    monkeypatch.setattr(se, "MAX_RETRY_AFTER_SEC", 60)
+    resp = HTTPResponse(status=500, headers={"Retry-After": "3600"})
+    retry = make_retry().increment("GET", "/events/search/", response=resp)
+    assert retry.total == 4
+
+
+class FakeResponse:
+    def __init__(self, status_code, text=""):
+        self.status_code = status_code
+        self.text = text
+
+
+class FakeSession:
+    def __init__(self, status_code):
+        self.status_code = status_code
+        self.calls = 0
+
+    def get(self, url, **kwargs):
+        self.calls += 1
+        return FakeResponse(self.status_code, "denied")
+
+
+@pytest.fixture
+def token_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(se, "CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(se, "TOKEN_CACHE_TTL_SEC", 3600)
+    return tmp_path / "cache"
+
+
+def test_validate_token_caches_success(token_cache):
+    session = FakeSession(200)
+    se.validate_token(session, "tok")
+    se.validate_token(session, "tok")
+    assert session.calls == 1
+    assert os.path.exists(se._token_cache_path("tok"))
+
+
+def test_validate_token_probes_again_after_ttl(token_cache, monkeypatch):
+    session = FakeSession(200)
+    se.validate_token(session, "tok")
+    past = time.time() - 7200
+    os.utime(se._token_cache_path("tok"), (past, past))
+    se.validate_token(session, "tok")
+    assert session.calls == 2
+
+
+def test_validate_token_is_keyed_per_token(token_cache):
+    se.validate_token(FakeSession(200), "good")
+    with pytest.raises(RuntimeError, match="token_invalid_or_forbidden:http_401"):
+        se.validate_token(FakeSession(401), "bad")
+    assert not os.path.exists(se._token_cache_path("bad"))
+
+
+def test_validate_token_survives_failed_cache_write(token_cache, monkeypatch):
+    def fail_makedirs(*args, **kwargs):
+        raise OSError("read-only")
+
+    monkeypatch.setattr(se.os, "makedirs", fail_makedirs)
+    session = FakeSession(200)
+    se.validate_token(session, "tok")
+    se.validate_token(session, "tok")
+    assert session.calls == 2
+
+
+def test_fetch_events_fails_when_cached_token_is_revoked(token_cache, monkeypatch):
+    se.validate_token(FakeSession(200), "tok")
+
+    def denied(session, query, state, *args):
+        return [], [f"auth_error_http_401:{state}:revoked"]
+
+    monkeypatch.setattr(se, "search_region", denied)
+    with pytest.raises(RuntimeError, match="token_invalid_or_forbidden:http_401:Montana"):
+        se.fetch_events("tok", states=["Montana", "Wyoming"])
+    assert not os.path.exists(se._token_cache_path("tok"))
+
+
+def test_fetch_events_keeps_partial_results_on_single_auth_error(token_cache, monkeypatch):
+    se.validate_token(FakeSession(200), "tok")
+
+    def search(session, query, state, *args):
+        if state == "Montana":
+            return [], ["auth_error_http_403:Montana:forbidden"]
+        return [make_event(id="1", start=(se.utc_now() + timedelta(days=1)).strftime(se.ISO_FORMAT))], []
+
+    monkeypatch.setattr(se, "search_region", search)
+    payload = se.fetch_events("tok", states=["Montana", "Wyoming"])
+    assert payload["generated"] is True
+    assert payload["count"] == 1
+    assert not os.path.exists(se._token_cache_path("tok"))
+
+
+@pytest.mark.skipif(se.CachedSession is None, reason="requests-cache not installed")
+def test_http_cache_key_varies_by_token():
+    import requests
+
+    def key(token):
+        request = requests.Request(
+            "GET",
+            f"{se.API_BASE}/events/search/",
+            params={"q": "veteran", "page": 1},
+            headers={"Authorization": f"Bearer {token}"},
+        ).prepare()
+        return se._http_cache_key(request)
+
+    assert key("one") == key("one")
+    assert key("one") != key("two")
+    assert "Bearer" not in key("one")